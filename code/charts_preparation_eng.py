@@ -1,8 +1,15 @@
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import matplotlib
+matplotlib.use('Agg')  # Charts are only written to files, never shown
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple
 
 # Get the directory where this script is located
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -11,7 +18,14 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PLOT_CONFIG = {
     'output_dir': os.path.join(SCRIPT_DIR, "../../UAB-data-engineering-project/charts/"),
     'data_dir': os.path.join(SCRIPT_DIR, "../../analysis-of-psychoactive-substance-use/data/"),
-    'dpi': 300,
+    'data_file': "NSDUH_2022_selected_columns_validated.csv",
+    'chunksize': None,  # Rows per chunk when streaming a CSV too large for memory
+    'dpi_default': 120,  # Pass dpi=300 to save_plot for print-quality output
+    'pil_kwargs': {
+        '.png': {'compress_level': 1},
+        '.jpg': {'quality': 85, 'optimize': False},
+        '.jpeg': {'quality': 85, 'optimize': False}
+    },
     'bbox_inches': 'tight',
     'figsize': (10, 6),
     'fontsize': {
@@ -21,245 +35,321 @@ PLOT_CONFIG = {
     }
 }
 
+# Columns actually used by the charts; everything else in the NSDUH file is skipped on load
+NEEDED_COLS = ['AGE3', 'COUTYP4', 'SEXIDENT', 'IRSEX', 'NEWRACE2', 'INCOME',
+               'CIGFLAG', 'ALCFLAG', 'MJEVER', 'COCEVER', 'HEREVER', 'LSD']
+
+# Every loaded column is a categorical code that ends up in a histogram
+CATEG_COLS = NEEDED_COLS
+
+# Columns whose codes always run from 1 to K, mapped to K
+CODE_RANGES = {
+    'COUTYP4': 3,
+    'SEXIDENT': 3,
+    'IRSEX': 2,
+    'CIGFLAG': 2,
+    'ALCFLAG': 2,
+    'MJEVER': 2,
+    'COCEVER': 2,
+    'HEREVER': 2,
+    'LSD': 2
+}
+
+# Category labels of each demographic column, in code order
+LABELS = {
+    'AGE3': ('4 - 18-20 years',
+             '5 - 21-23 years',
+             '6 - 24-25 years',
+             '7 - 26-29 years',
+             '8 - 30-34 years',
+             '9 - 35-49 years',
+             '10 - 50-64 years',
+             '11 - 65+ years'),
+    'COUTYP4': ('Large Metro', 'Small Metro', 'Non-Metro'),
+    'SEXIDENT': ('Heterosexual', 'Homosexual', 'Bisexual'),
+    'IRSEX': ('Male', 'Female'),
+    'NEWRACE2': ('1 - White',
+                 '2 - Black or African American',
+                 '3 - Native American',
+                 '4 - Native Hawaiian/Pacific Islander',
+                 '5 - Asian',
+                 '6 - More than one race',
+                 '7 - Hispanic/Latino'),
+    'INCOME': ('1 - Less than $20,000',
+               '2 - $20,000-$49,999',
+               '3 - $50,000-$74,999',
+               '4 - More than $75,000')
+}
+
+# Bar colors of each demographic column, in code order
+PALETTES = {
+    'AGE3': ('skyblue', 'lightcoral', 'lightgreen', 'gold', 'lightsalmon',
+             'lightseagreen', 'lightpink', 'lightsteelblue'),
+    'COUTYP4': ('skyblue', 'lightgreen', 'lightsalmon'),
+    'SEXIDENT': ('skyblue', 'lightgreen', 'lightsalmon'),
+    'IRSEX': ('skyblue', 'pink'),
+    'NEWRACE2': ('skyblue', 'lightcoral', 'lightgreen', 'gold', 'lightsalmon', 'lightseagreen', 'lightpink'),
+    'INCOME': ('skyblue', 'lightcoral', 'lightgreen', 'gold', 'lightsalmon', 'lightseagreen', 'lightpink',
+               'lightsteelblue', 'lightyellow', 'lightgrey', 'lightcyan')
+}
+
+# Chart settings of each demographic column, plotted by plot_categorical
+META = {
+    'AGE3': {
+        'title': 'Distribution of Participants by Age Group (AGE3)',
+        'xlabel': 'Age Group',
+        'labels': LABELS['AGE3'],
+        'colors': PALETTES['AGE3'],
+        'legend': 'upper left',
+        'rotation': 45,
+        'filename': 'histogram_age3_eng.jpg'
+    },
+    'COUTYP4': {
+        'title': 'Distribution of Participants by Residence Type (COUTYP4)',
+        'labels': LABELS['COUTYP4'],
+        'colors': PALETTES['COUTYP4'],
+        'width': 0.5,
+        'filename': 'histogram_coutyp4_eng.jpg'
+    },
+    'SEXIDENT': {
+        'title': 'Distribution of Participants by Sexual Orientation (SEXIDENT)',
+        'labels': LABELS['SEXIDENT'],
+        'colors': PALETTES['SEXIDENT'],
+        'width': 0.5,
+        'filename': 'histogram_sexident_eng.jpg'
+    },
+    'IRSEX': {
+        'title': 'Distribution of participants by gender (IRSEX)',
+        'labels': LABELS['IRSEX'],
+        'colors': PALETTES['IRSEX'],
+        'width': 0.3,
+        'filename': 'histogram_irsex_eng.jpg'
+    },
+    'NEWRACE2': {
+        'title': 'Distribution of participants by ethnic origin (NEWRACE2)',
+        'labels': LABELS['NEWRACE2'],
+        'colors': PALETTES['NEWRACE2'],
+        'legend': 'upper right',
+        'rotation': 45,
+        'filename': 'histogram_newrace2_eng.jpg'
+    },
+    'INCOME': {
+        'title': 'Distribution of Participants by Income Group (INCOME)',
+        'xlabel': 'Total Annual Family Income',
+        'labels': LABELS['INCOME'],
+        'colors': PALETTES['INCOME'],
+        'legend': 'upper left',
+        'filename': 'histograph_income_eng.jpg'
+    }
+}
+
+# Single figure reused by every chart instead of building a new one per plot
+_FIG, _AX = plt.subplots(figsize=PLOT_CONFIG['figsize'])
+
+def reset_axes() -> plt.Axes:
+    """Clear the shared axes and return them ready for the next chart."""
+    _AX.clear()
+    _FIG.set_size_inches(PLOT_CONFIG['figsize'])
+    # Restore the default margins so no chart inherits layout changes from the previous one
+    _FIG.subplots_adjust(**{side: plt.rcParams[f'figure.subplot.{side}']
+                            for side in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')})
+    return _AX
+
+@lru_cache(maxsize=1)
+def _ensure_outdir() -> str:
+    """Create the output directory once per process and return it."""
+    os.makedirs(PLOT_CONFIG['output_dir'], exist_ok=True)
+    return PLOT_CONFIG['output_dir']
+
 def configure_output(filename: str) -> str:
     """Configure and create output directory, return full output path."""
-    os.makedirs(PLOT_CONFIG['output_dir'], exist_ok=True)
-    return os.path.join(PLOT_CONFIG['output_dir'], filename)
+    return os.path.join(_ensure_outdir(), filename)
 
-def save_plot(filename: str) -> None:
+def save_plot(filename: str, dpi: int = PLOT_CONFIG['dpi_default']) -> None:
     """Save plot with standardized configuration."""
     output_path = configure_output(filename)
+    extension = os.path.splitext(filename)[1].lower()
+    # Encoder options only apply to raster formats; vector backends reject pil_kwargs
+    options = {}
+    if extension in PLOT_CONFIG['pil_kwargs']:
+        options['pil_kwargs'] = PLOT_CONFIG['pil_kwargs'][extension]
     print(f"Attempting to save to: {output_path}")
-    plt.savefig(
+    _FIG.savefig(
         output_path,
-        dpi=PLOT_CONFIG['dpi'],
-        bbox_inches=PLOT_CONFIG['bbox_inches']
+        dpi=dpi,
+        bbox_inches=PLOT_CONFIG['bbox_inches'],
+        **options
     )
     print(f"✓ Successfully saved plot to: {output_path}")
-    plt.close()
+
+def convert_to_parquet(df: pd.DataFrame, parquet_path: str) -> None:
+    """Write the loaded columns to a Parquet file so later runs can skip CSV parsing."""
+    # Write to a temporary file first, so an interrupted write never leaves a truncated copy behind
+    tmp_path = parquet_path + ".tmp"
+    try:
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), tmp_path)
+        os.replace(tmp_path, parquet_path)
+    except OSError as e:
+        # The Parquet copy is only a speed-up, so a read-only data directory must not stop the charts
+        print(f"✗ Could not cache data as Parquet at {parquet_path}: {str(e)}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return
+    print(f"✓ Cached data as Parquet at: {parquet_path}")
+
+def _parquet_is_current(parquet_path: str, data_path: str) -> bool:
+    """Check that the Parquet copy exists, is not older than the CSV and has every needed column."""
+    if not os.path.exists(parquet_path):
+        return False
+    if os.path.exists(data_path) and os.path.getmtime(parquet_path) < os.path.getmtime(data_path):
+        return False
+    try:
+        schema = pq.read_schema(parquet_path)
+    except (pa.ArrowInvalid, OSError):
+        # An unreadable copy is treated as stale and rebuilt from the CSV
+        return False
+    return set(NEEDED_COLS) <= set(schema.names)
+
+@lru_cache(maxsize=4)
+def _load(data_path: str, mtime: float) -> pd.DataFrame:
+    """Read and type the data behind data_path; mtime of the source only keys the cache.
+
+    The returned DataFrame is shared between cache hits, so callers must not modify it.
+    """
+    parquet_path = os.path.splitext(data_path)[0] + ".parquet"
+
+    df = None
+    if _parquet_is_current(parquet_path, data_path):
+        print(f"Loading data from: {parquet_path}")
+        try:
+            df = pd.read_parquet(parquet_path, columns=NEEDED_COLS)
+        except (pa.ArrowInvalid, OSError) as e:
+            print(f"✗ Could not read Parquet copy at {parquet_path}: {str(e)}")
+
+    if df is None:
+        print(f"Loading data from: {data_path}")
+        # All used columns hold small integer codes, so int8 is enough
+        df = pd.read_csv(data_path, usecols=NEEDED_COLS,
+                         dtype={col: 'int8' for col in NEEDED_COLS}, engine='c')
+        convert_to_parquet(df, parquet_path)
+
+    # Each column has only a handful of codes, so counting works on the category codes
+    for col in CATEG_COLS:
+        df[col] = df[col].astype('category')
+    return df
 
 def load_data() -> pd.DataFrame:
-    """Load data with proper path handling."""
-    data_path = os.path.join(PLOT_CONFIG['data_dir'], "NSDUH_2022_selected_columns_validated.csv")
-    print(f"Loading data from: {data_path}")
+    """Load data with proper path handling, preferring a Parquet copy of the CSV."""
+    data_path = os.path.join(PLOT_CONFIG['data_dir'], PLOT_CONFIG['data_file'])
+    parquet_path = os.path.splitext(data_path)[0] + ".parquet"
+    # Key the cache on the CSV, so writing its Parquet copy does not change the key
+    source_path = data_path if os.path.exists(data_path) else parquet_path
     
-    if not os.path.exists(data_path):
+    if not os.path.exists(source_path):
         raise FileNotFoundError(f"Data file not found at: {data_path}")
     
-    return pd.read_csv(data_path)
-
-def histograph_age(df: pd.DataFrame) -> None:
-    """Create a histogram visualization of age group distribution."""
-    # Plot configuration
-    colors = ['skyblue', 'lightcoral', 'lightgreen', 'gold', 'lightsalmon',
-             'lightseagreen', 'lightpink', 'lightsteelblue']
-    labels = ['4 - 18-20 years',
-             '5 - 21-23 years',
-             '6 - 24-25 years',
-             '7 - 26-29 years',
-             '8 - 30-34 years',
-             '9 - 35-49 years',
-             '10 - 50-64 years',
-             '11 - 65+ years']
-
-    age_counts = df['AGE3'].value_counts().sort_index()
-
-    plt.figure(figsize=PLOT_CONFIG['figsize'])
-    bars = plt.bar(age_counts.index, age_counts.values, color=colors[:len(age_counts)])
-
-    plt.xticks(age_counts.index, range(4, 12), rotation=45, ha='right')
-    plt.ylabel('Number of Participants', fontsize=PLOT_CONFIG['fontsize']['axis'])
-    plt.xlabel('Age Group', fontsize=PLOT_CONFIG['fontsize']['axis'])
-    plt.title('Distribution of Participants by Age Group (AGE3)', 
-             fontsize=PLOT_CONFIG['fontsize']['title'])
-    plt.legend(bars, labels, loc='upper left', fontsize=PLOT_CONFIG['fontsize']['legend'])
-
-    save_plot("histogram_age3_eng.jpg")
-    plt.tight_layout()
-    plt.show()
-
-def histograph_coutyp4(df: pd.DataFrame) -> None:
-    """Create histogram of place types."""
-    # Data preparation
-    groups = {
-        'Large Metro': df[df['COUTYP4'] == 1],
-        'Small Metro': df[df['COUTYP4'] == 2],
-        'Non-Metro': df[df['COUTYP4'] == 3]
-    }
-    counts = [len(g) for g in groups.values()]
-    colors = ['skyblue', 'lightgreen', 'lightsalmon']
-    labels = ['Large Metro', 'Small Metro', 'Non-Metro']
-
-    # Create plot
-    plt.figure(figsize=PLOT_CONFIG['figsize'])
-    bars = plt.bar(range(3), counts, color=colors, width=0.5)
-    
-    # Add annotations
-    for bar in bars:
-        yval = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2, yval + 0.1, int(yval), 
-                ha='center', va='bottom')
-
-    # Configure plot
-    plt.xticks(range(3), labels)
-    plt.title('Distribution of Participants by Residence Type (COUTYP4)',
-             fontsize=PLOT_CONFIG['fontsize']['title'])
-    plt.ylabel('Number of Participants', fontsize=PLOT_CONFIG['fontsize']['axis'])
-
-    save_plot("histogram_coutyp4_eng.jpg")
-    plt.tight_layout()
-    plt.show()
-
-# Function for creating a histogram of sexual identity
-def histograph_sexident(df: pd.DataFrame) -> None:
-    # Dividing the rows into groups
-    homo = df[df['SEXIDENT'] == 1]
-    hetero = df[df['SEXIDENT'] == 2]
-    bi = df[df['SEXIDENT'] == 3]
-
-    # Creating the histogram
-    plt.hist([homo['SEXIDENT'], hetero['SEXIDENT'], bi['SEXIDENT']], bins=range(1, 5), rwidth=0)
+    # Hand out a copy so callers cannot alter the cached DataFrame
+    return _load(data_path, os.path.getmtime(source_path)).copy()
+
+def _series_from_totals(col: str, totals: np.ndarray) -> pd.Series:
+    """Turn bincount totals of a column into the counts Series the charts expect."""
+    if col in CODE_RANGES:
+        K = CODE_RANGES[col]
+        return pd.Series(totals[1:K + 1], index=range(1, K + 1))
+    present = np.flatnonzero(totals)
+    return pd.Series(totals[present], index=present)
+
+def load_counts(chunksize: int) -> Dict[str, pd.Series]:
+    """Stream the CSV in chunks and accumulate category counts without keeping any rows."""
+    data_path = os.path.join(PLOT_CONFIG['data_dir'], PLOT_CONFIG['data_file'])
+    print(f"Streaming data from: {data_path}")
 
-    # Adding ticks, titles and labels
-    plt.xticks([1, 2, 3], ['Heterosexual', 'Homosexual', 'Bisexual'])
-    plt.title('Distribution of Participants by Sexual Orientation (SEXIDENT)')
-    plt.ylabel('Number of Participants')
-
-    # Adjusting the bars
-    counts = [homo.shape[0], hetero.shape[0], bi.shape[0]]
-    bars = plt.bar(range(1, 4), counts, color=['skyblue', 'lightgreen', 'lightsalmon'], width=0.5, align='center')
-    for bar in bars:
-        yval = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width() / 2, yval + 0.1, int(yval), ha='center', va='bottom')
-
-    # Saving and displaying the plot
-    save_plot("histogram_sexident_eng.jpg")
-    plt.tight_layout()
-    plt.show()
-
-# Function for creating a histogram of gender
-def histograph_irsex(df: pd.DataFrame) -> None:
-    # Dividing the rows into groups
-    male = df[df['IRSEX'] == 1]
-    female = df[df['IRSEX'] == 2]
-
-    # Creating the histogram
-    plt.hist([male['IRSEX'], female['IRSEX']], bins=range(1, 4), color=['skyblue', 'pink'], rwidth=0.3, align='left')
-
-    # Adding ticks, titles and labels
-    plt.xticks([1, 2], ['Male', 'Female'])
-    plt.title('Distribution of participants by gender (IRSEX)')
-    plt.ylabel('Number of participants')
+    if not os.path.exists(data_path):
+        raise FileNotFoundError(f"Data file not found at: {data_path}")
 
-    # Adjusting the bars
-    bars = plt.bar(range(1, 3), [male.shape[0], female.shape[0]], color=['skyblue', 'pink'], width=0.3)
-    for bar in bars:
-        yval = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width() / 2, yval + 0.1, round(yval, 2), ha='center', va='bottom')
-
-    # Saving and displaying the plot
-    save_plot("histogram_irsex_eng.jpg")
-    plt.tight_layout()
-    plt.show()
-
-# Function for creating a histogram of ethnic background
-def histograph_newrace2(df: pd.DataFrame) -> None:
-    # Defining colors and labels for ethnic groups
-    colors = ['skyblue', 'lightcoral', 'lightgreen', 'gold', 'lightsalmon', 'lightseagreen', 'lightpink']
-    labels = [
-        '1 - White',
-        '2 - Black or African American',
-        '3 - Native American',
-        '4 - Native Hawaiian/Pacific Islander',
-        '5 - Asian',
-        '6 - More than one race',
-        '7 - Hispanic/Latino'
-    ]
-
-    # Getting ethnic background and sorting them
-    race_counts = df['NEWRACE2'].value_counts().sort_index()
-    bars = plt.bar(race_counts.index, race_counts.values, color=colors[:len(race_counts)])
-
-    # Setting ticks, labels, and title
-    plt.xticks(race_counts.index, range(1, 8), rotation=45, ha='right')
-    plt.ylabel('Number of participants')
-    plt.title('Distribution of participants by ethnic origin (NEWRACE2)')
-    plt.legend(bars, labels, loc='upper right')
-
-    # Saving and displaying the plot
-    save_plot("histogram_newrace2_eng.jpg")
-    plt.tight_layout()
-    plt.show()
-
-# Function for creating a histogram of income levels
-def histograph_income(df: pd.DataFrame) -> None:
-    # Defining colors and labels for income levels
-    colors = ['skyblue', 'lightcoral', 'lightgreen', 'gold', 'lightsalmon', 'lightseagreen', 'lightpink',
-              'lightsteelblue', 'lightyellow', 'lightgrey', 'lightcyan']
-    labels = ['1 - Less than $20,000',
-          '2 - $20,000-$49,999',
-          '3 - $50,000-$74,999', 
-          '4 - More than $75,000']
-
-    # Getting counts and sorting them
-    income_counts = df['INCOME'].value_counts().sort_index()
-
-    # Creating bars for the histogram
-    bars = plt.bar(income_counts.index, income_counts.values, color=colors[:len(income_counts)])
-
-    # Setting ticks, labels, and title
-    plt.xticks(income_counts.index, range(1, 5), ha='right')
-    plt.ylabel('Number of Participants')
-    plt.xlabel('Total Annual Family Income') 
-    plt.title('Distribution of Participants by Income Group (INCOME)')
-
-    # Creating legend
-    plt.legend(bars, labels, loc='upper left')
-
-    # Saving and displaying the plot
-    save_plot("histograph_income_eng.jpg")
-    plt.tight_layout()
-    plt.show()
+    totals = {col: np.zeros(CODE_RANGES.get(col, 0) + 1, dtype=np.int64) for col in CATEG_COLS}
+    with pd.read_csv(data_path, usecols=NEEDED_COLS, dtype={col: 'int8' for col in NEEDED_COLS},
+                     engine='c', chunksize=chunksize) as reader:
+        for chunk in reader:
+            for col in CATEG_COLS:
+                # minlength keeps the chunk counts at least as long as the running totals
+                chunk_counts = np.bincount(chunk[col].to_numpy(dtype=np.intp), minlength=len(totals[col]))
+                chunk_counts[:len(totals[col])] += totals[col]
+                totals[col] = chunk_counts
+
+    return {col: _series_from_totals(col, totals[col]) for col in CATEG_COLS}
+
+def _counts(df: pd.DataFrame, col: str) -> np.ndarray:
+    """Count occurrences of each code value of a categorical column in one bincount pass."""
+    categories = df[col].cat.categories.to_numpy()
+    by_category = np.bincount(df[col].cat.codes.to_numpy(), minlength=len(categories))
+    # Spread the per-category counts out by code value, as load_counts produces them
+    totals = np.zeros(max(categories.max(), CODE_RANGES.get(col, 0)) + 1, dtype=np.int64)
+    totals[categories] = by_category
+    return totals
+
+def count_categories(df: pd.DataFrame) -> Dict[str, pd.Series]:
+    """Count participants per code of every categorical column once, before any plotting."""
+    return {col: _series_from_totals(col, _counts(df, col)) for col in CATEG_COLS}
+
+def plot_categorical(counts: pd.Series, meta: dict) -> None:
+    """Create a bar chart of participants per category of one demographic column."""
+    ax = reset_axes()
+    bars = ax.bar(counts.index, counts.values, color=meta['colors'][:len(counts)],
+                  width=meta.get('width', 0.8))
+
+    if meta.get('legend'):
+        # Codes on the axis, their meaning in the legend
+        ax.set_xticks(counts.index, counts.index, rotation=meta.get('rotation', 0), ha='right')
+        ax.legend(bars, meta['labels'], loc=meta['legend'], fontsize=PLOT_CONFIG['fontsize']['legend'])
+    else:
+        # Category names on the axis, counts above the bars
+        ax.set_xticks(counts.index, meta['labels'])
+        ax.bar_label(bars, labels=[str(int(v)) for v in counts.values], padding=3,
+                     fontsize=PLOT_CONFIG['fontsize']['legend'])
+
+    ax.set_ylabel('Number of Participants', fontsize=PLOT_CONFIG['fontsize']['axis'])
+    if meta.get('xlabel'):
+        ax.set_xlabel(meta['xlabel'], fontsize=PLOT_CONFIG['fontsize']['axis'])
+    ax.set_title(meta['title'], fontsize=PLOT_CONFIG['fontsize']['title'])
+
+    save_plot(meta['filename'])
 
 # Function for creating a histogram of drug usage
-def histograph_drug(df: pd.DataFrame, drug_column_name: str, drug_name: str, drug_values: List[int], drug_labels: List[str]) -> None:
-    # Dividing the rows into groups
-    taken = df[df[drug_column_name] == 1]
-    not_taken = df[df[drug_column_name] == 2]
-
-    # Creating the histogram
-    plt.hist([taken[drug_column_name], not_taken[drug_column_name]], bins=range(1, 4), color=['lightsalmon', 'skyblue'],
-             rwidth=0.3, align='left')
+def histograph_drug(drug_counts: pd.Series, drug_column_name: str, drug_name: str, drug_values: List[int], drug_labels: List[str]) -> None:
+    # Getting the group sizes
+    taken, not_taken = drug_counts.values
+    ax = reset_axes()
 
     # Adding ticks, titles and labels
-    plt.xticks(drug_values, drug_labels)
-    plt.title(f'Distribution of participants by {drug_name} usage ({drug_column_name})')
-    plt.ylabel('Number of participants')
+    ax.set_xticks(drug_values, drug_labels)
+    ax.set_title(f'Distribution of participants by {drug_name} usage ({drug_column_name})')
+    ax.set_ylabel('Number of participants')
 
     # Adjusting the bars
-    bars = plt.bar(range(1, 3), [taken.shape[0], not_taken.shape[0]], color=['lightsalmon', 'skyblue'], width=0.3)
-    for bar in bars:
-        yval = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width() / 2, yval + 0.1, round(yval, 2), ha='center', va='bottom')
+    bars = ax.bar(range(1, 3), [taken, not_taken], color=['lightsalmon', 'skyblue'], width=0.3)
+    ax.bar_label(bars, labels=[str(int(v)) for v in (taken, not_taken)], padding=3,
+                 fontsize=PLOT_CONFIG['fontsize']['legend'])
 
-    # Saving and displaying the plot
+    # Saving the plot
     save_plot(f"histographs_drug_{drug_name}_eng.jpg")
-    plt.tight_layout()
-    plt.show()
+
+def render(task: Tuple[Callable[..., None], Tuple[Any, ...]]) -> None:
+    """Draw and save a single chart; runs inside a worker process."""
+    plot_function, args = task
+    plot_function(*args)
 
 def main() -> None:    
     try:
-        df = load_data()
+        if PLOT_CONFIG['chunksize']:
+            counts = load_counts(PLOT_CONFIG['chunksize'])
+        else:
+            counts = count_categories(load_data())
 
-        # Generating histograms of demographic variables
-        histograph_age(df)
-        histograph_coutyp4(df)
-        histograph_sexident(df)
-        histograph_irsex(df)
-        histograph_newrace2(df)
-        histograph_income(df)
+        # Histograms of demographic variables
+        tasks = [(plot_categorical, (counts[col], meta)) for col, meta in META.items()]
 
-        # Generating histograms of substance use variables
+        # Histograms of substance use variables
         drug_config = [
             ('CIGFLAG', 'Cigarettes', [1, 2], ['Used', 'Never used']),
             ('ALCFLAG', 'Alcohol', [1, 2], ['Used', 'Never used']),
@@ -270,7 +360,17 @@ def main() -> None:
         ]
         
         for col, name, vals, labels in drug_config:
-            histograph_drug(df, col, name, vals, labels)
+            tasks.append((histograph_drug, (counts[col], col, name, vals, labels)))
+
+        # Charts only depend on the precomputed counts, so they are rendered in parallel
+        max_workers = min(len(tasks), os.cpu_count() or 1)
+        if max_workers == 1:
+            # A pool only adds start-up cost when there is a single core to run on
+            for task in tasks:
+                render(task)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(render, tasks))
 
     except FileNotFoundError as e:
         print(f"✗ Error: {str(e)}")